@@ -3,12 +3,16 @@
 
 from .weather_service import WeatherAnalysisService
 from .classification_service import WeatherClassificationService
-from .weather_utils import calculate_heat_index, calculate_historical_stats, predict_with_temporal_regression
+from .weather_utils import (
+    calculate_heat_index, calculate_heat_index_array, calculate_historical_stats,
+    predict_with_temporal_regression
+)
 
 __all__ = [
     "WeatherAnalysisService",
     "WeatherClassificationService", 
     "calculate_heat_index",
+    "calculate_heat_index_array",
     "calculate_historical_stats",
     "predict_with_temporal_regression",
 ]
\ No newline at end of file
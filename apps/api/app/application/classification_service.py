@@ -8,13 +8,21 @@ import numpy as np
 from scipy.stats import percentileofscore
 from ..domain.entities import WeatherClassifications
 from ..domain.enums import Granularity
-from .weather_utils import calculate_heat_index, get_sanitized_series
+from .weather_utils import (
+    calculate_heat_index, calculate_heat_index_array, day_of_year, get_sanitized_series,
+    seasonal_window_mask, series_to_arrays
+)
 
 
 logger = logging.getLogger("outdoor_risk_api.classification_service")
 
 
 class WeatherClassificationService:
+    # Classification Thresholds
+    RAIN_THRESHOLD_MM: float = 0.1  # Precipitation above which a period counts as rainy
+    SNOW_MAX_TEMP_C: float = 2.0  # Mean temperature above which snow is ruled out
+    WET_PRECIP_PERCENTILE: float = 90  # Historical precipitation percentile for "very wet"
+    WET_WIND_PERCENTILE: float = 75  # Historical wind percentile for "very wet"
     
     def calculate_classifications(
         self,
@@ -97,26 +105,16 @@ class WeatherClassificationService:
         window_days: int = 15
     ) -> Optional[float]:
         """Calculate probability of rain based on historical seasonal data."""
-        target_doy = target_dt_utc.timetuple().tm_yday
-        doy_range = {(target_doy - 1 + i) % 365 + 1 for i in range(-window_days, window_days + 1)}
-        
-        seasonal_precip = []
-        historical_precip_series = all_historical_series.get(precip_param, {})
-        
-        for date_str, value in historical_precip_series.items():
-            try:
-                date_format = "%Y%m%d%H" if granularity == Granularity.HOURLY else "%Y%m%d"
-                d = datetime.strptime(date_str, date_format)
-                
-                if d.timetuple().tm_yday in doy_range and value is not None:
-                    seasonal_precip.append(value)
-                    
-            except (ValueError, TypeError):
-                continue
-        
-        if seasonal_precip:
-            rainy_events = sum(1 for p in seasonal_precip if p > 0.1)
-            return rainy_events / len(seasonal_precip)
+        in_season = seasonal_window_mask(day_of_year(target_dt_utc), window_days)
+        
+        _, days_of_year, _, values = series_to_arrays(
+            all_historical_series.get(precip_param, {}), granularity
+        )
+        seasonal_precip = values[in_season[days_of_year]]
+        
+        if seasonal_precip.size:
+            rainy_events = int(np.count_nonzero(seasonal_precip > self.RAIN_THRESHOLD_MM))
+            return rainy_events / seasonal_precip.size
         
         return None
     
@@ -126,7 +124,7 @@ class WeatherClassificationService:
         all_historical_series: Dict[str, Dict[str, float]]
     ) -> Optional[float]:
         """Calculate probability of snow based on temperature and historical data."""
-        if predicted_t_avg is not None and predicted_t_avg > 2.0:
+        if predicted_t_avg is not None and predicted_t_avg > self.SNOW_MAX_TEMP_C:
             return 0.0
         
         hist_snow = get_sanitized_series(all_historical_series, "FRSNO")
@@ -146,16 +144,15 @@ class WeatherClassificationService:
         hist_t_avg_series = all_historical_series.get("T2M", {})
         hist_rh2m_series = all_historical_series.get("RH2M", {})
         
-        historical_heat_index = []
+        hist_t_avg = np.array(list(hist_t_avg_series.values()), dtype=np.float64)
+        hist_rh2m = np.array(
+            [hist_rh2m_series.get(date_key) for date_key in hist_t_avg_series], dtype=np.float64
+        )
         
-        for date_key, t_avg in hist_t_avg_series.items():
-            rh = hist_rh2m_series.get(date_key)
-            if t_avg is not None and rh is not None:
-                hi = calculate_heat_index(t_avg, rh)
-                if hi is not None:
-                    historical_heat_index.append(hi)
+        historical_heat_index = calculate_heat_index_array(hist_t_avg, hist_rh2m)
+        historical_heat_index = historical_heat_index[~np.isnan(historical_heat_index)]
         
-        if historical_heat_index:
+        if historical_heat_index.size:
             predicted_heat_index = calculate_heat_index(predicted_t_avg, predicted_rh2m)
             if predicted_heat_index is not None:
                 return percentileofscore(historical_heat_index, predicted_heat_index, kind='rank')/100
@@ -174,20 +171,22 @@ class WeatherClassificationService:
         if not hist_precip_full or not hist_wind:
             return {"probability": None, "precip_threshold": None, "wind_threshold": None}
         
-        precip_threshold = np.percentile(hist_precip_full, 90)
-        wind_threshold = np.percentile(hist_wind, 75)
+        precip_threshold = np.percentile(hist_precip_full, self.WET_PRECIP_PERCENTILE)
+        wind_threshold = np.percentile(hist_wind, self.WET_WIND_PERCENTILE)
         
-        stormy_events = 0
         total_events = len(all_historical_series.get("T2M", {}))
         
         hist_precip_series = all_historical_series.get(precip_param, {})
         hist_wind_series = all_historical_series.get("WS10M", {})
         
-        for date_key, precip_val in hist_precip_series.items():
-            wind_val = hist_wind_series.get(date_key)
-            if (precip_val is not None and wind_val is not None and 
-                precip_val > precip_threshold and wind_val > wind_threshold):
-                stormy_events += 1
+        # Missing values become NaN, which never exceeds a threshold
+        precip_values = np.array(list(hist_precip_series.values()), dtype=np.float64)
+        wind_values = np.array(
+            [hist_wind_series.get(date_key) for date_key in hist_precip_series], dtype=np.float64
+        )
+        stormy_events = int(np.count_nonzero(
+            (precip_values > precip_threshold) & (wind_values > wind_threshold)
+        ))
         
         probability = stormy_events / total_events if total_events > 0 else 0.0
         
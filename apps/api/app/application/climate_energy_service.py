@@ -1,8 +1,9 @@
 # ABOUTME: Climate energy analysis service implementation with NASA API integration  
 # ABOUTME: Orchestrates climate data fetching and energy potential calculations
 
+import asyncio
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Union
 from ..domain.climate_interfaces import IClimateEnergyService, INASAClimateRepository
 from ..domain.climate_entities import (
     ClimateEnergyAnalysisRequest,
@@ -49,43 +50,13 @@ class ClimateEnergyService(IClimateEnergyService):
             Complete analysis results with metadata and errors
         """
         start_time = time.perf_counter()
-        analysis_results = []
-        failed_locations = []
-        param_list = list(self.API_PARAMETERS_MAP.values())
-
-        for location_input in request.locations:
-            try:
-                api_data = await self.nasa_repository.fetch_climatology_data(
-                    location_input.latitude, 
-                    location_input.longitude, 
-                    param_list
-                )
-                
-                if not api_data:
-                    raise ValueError("Empty API response")
-                
-                solar_kwh_per_m2 = self._calculate_solar_kwh_per_m2(api_data)
-                wind_kwh_per_m2 = self._calculate_wind_kwh_per_m2(api_data)
-                
-                raw_metrics = {
-                    key: api_data.get(value, {}) 
-                    for key, value in self.API_PARAMETERS_MAP.items()
-                }
-                
-                analysis_results.append(LocationResult(
-                    location=location_input,
-                    climate_energy_potential=ClimateEnergyPotential(
-                        solar_kwh_per_m2=solar_kwh_per_m2,
-                        wind_kwh_per_m2=wind_kwh_per_m2
-                    ),
-                    raw_nasa_metrics_monthly=raw_metrics
-                ))
-                
-            except Exception as e:
-                failed_locations.append(LocationError(
-                    location=location_input,
-                    error=str(e)
-                ))
+        
+        outcomes = await asyncio.gather(*(
+            self._analyze_location(location_input) for location_input in request.locations
+        ))
+        
+        analysis_results = [o for o in outcomes if isinstance(o, LocationResult)]
+        failed_locations = [o for o in outcomes if isinstance(o, LocationError)]
 
         duration = time.perf_counter() - start_time
         
@@ -100,6 +71,25 @@ class ClimateEnergyService(IClimateEnergyService):
             errors=failed_locations
         )
     
+    async def _analyze_location(
+        self,
+        location_input: LocationInput
+    ) -> Union[LocationResult, LocationError]:
+        """        
+        Args:
+            location_input: Location to analyze
+            
+        Returns:
+            Analysis result for the location, or the error that prevented it
+        """
+        try:
+            return await self.analyze_single_location(location_input.latitude, location_input.longitude)
+        except Exception as e:
+            return LocationError(
+                location=location_input,
+                error=str(e)
+            )
+    
     def _calculate_solar_kwh_per_m2(self, api_data: Dict[str, Any]) -> Dict[str, float]:
         """        
         Args:
@@ -1,6 +1,7 @@
 # ABOUTME: Main weather analysis service implementing business logic
 # ABOUTME: Orchestrates data fetching, processing, and analysis for weather risk assessment
 
+import asyncio
 import logging
 from datetime import datetime, date, timedelta, timezone
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
@@ -12,10 +13,11 @@ from ..domain.entities import (
 from ..domain.enums import Granularity, AnalysisMode
 from ..domain.interfaces import IWeatherDataRepository, IWeatherAnalysisService
 from ..infrastructure.config import (
-    DEFAULT_PARAMS, CLIMATOLOGY_PARAMS, HOURLY_UNAVAILABLE_PARAMS
+    DEFAULT_PARAMS, CLIMATOLOGY_PARAMS, HOURLY_UNAVAILABLE_PARAMS, HOURLY_CHUNK_CONCURRENCY
 )
 from .weather_utils import (
-    calculate_historical_stats, predict_with_temporal_regression, calculate_heat_index
+    calculate_historical_stats, predict_from_arrays, calculate_heat_index, series_to_arrays,
+    SeriesArrays
 )
 from .classification_service import WeatherClassificationService
 
@@ -63,23 +65,31 @@ class WeatherAnalysisService(IWeatherAnalysisService):
         
         # Prepare parameters
         parameters = request.parameters or DEFAULT_PARAMS
-        essential_params = {"T2M", "RH2M", "T2M_MAX", "WS10M", "PRECTOTCORR", "IMERG_PRECTOT", "FRSNO"}
-        params_to_fetch = list(set(parameters) | essential_params)
+        essential_params = ["T2M", "RH2M", "T2M_MAX", "WS10M", "PRECTOTCORR", "IMERG_PRECTOT", "FRSNO"]
+        # Order-preserving dedup keeps NASA request URLs (and cache keys) stable
+        params_to_fetch = list(dict.fromkeys([*parameters, *essential_params]))
         
         # Remove hourly unavailable parameters if needed
         if request.granularity == Granularity.HOURLY:
             params_to_fetch = [p for p in params_to_fetch if p not in HOURLY_UNAVAILABLE_PARAMS]
         
-        # Fetch climatology data
-        clim_json = await self.weather_repo.fetch_climatology(
-            request.latitude, request.longitude, CLIMATOLOGY_PARAMS
-        )
-        clim_map = self.weather_repo.extract_climatology_monthly(clim_json)
-        
-        # Fetch historical data
-        all_series = await self._fetch_historical_data(
-            request, params_to_fetch
-        )
+        # Fetch climatology and historical data concurrently; a failure in
+        # either cancels the other instead of leaving it running
+        try:
+            async with asyncio.TaskGroup() as tg:
+                clim_task = tg.create_task(self.weather_repo.fetch_climatology(
+                    request.latitude, request.longitude, CLIMATOLOGY_PARAMS
+                ))
+                historical_task = tg.create_task(
+                    self._fetch_historical_data(request, params_to_fetch)
+                )
+        except ExceptionGroup as eg:
+            for extra_error in eg.exceptions[1:]:
+                logger.warning("Concurrent fetch also failed", exc_info=extra_error)
+            # Re-raise the original error so callers can map it to a response
+            raise eg.exceptions[0] from eg
+        clim_map = self.weather_repo.extract_climatology_monthly(clim_task.result())
+        all_series = historical_task.result()
         
         # Calculate historical statistics
         historical_stats = calculate_historical_stats(all_series)
@@ -142,13 +152,15 @@ class WeatherAnalysisService(IWeatherAnalysisService):
                     request.latitude, request.longitude, request.granularity,
                     start_date_fetch, end_date_available, params_to_fetch
                 )
-                all_series = self.weather_repo.extract_param_series(historical_json)
+                all_series.update(self.weather_repo.extract_param_series(historical_json))
                 
             except Exception as e:
                 logger.warning(f"Failed to fetch daily historical data: {e}")
                 
-        else:  # Hourly data - fetch in chunks
-            for year in range(start_date_fetch.year, end_date_available.year + 1, request.hourly_chunk_years):
+        else:  # Hourly data - fetch chunks concurrently
+            semaphore = asyncio.Semaphore(HOURLY_CHUNK_CONCURRENCY)
+            
+            async def fetch_chunk(year: int) -> Dict[str, Dict[str, float]]:
                 chunk_start_dt = date(year, 1, 1)
                 chunk_end_dt = date(
                     min(year + request.hourly_chunk_years - 1, end_date_available.year), 12, 31
@@ -158,19 +170,32 @@ class WeatherAnalysisService(IWeatherAnalysisService):
                     chunk_end_dt = end_date_available
                 
                 try:
-                    hourly_json = await self.weather_repo.fetch_temporal_data(
-                        request.latitude, request.longitude, request.granularity,
-                        chunk_start_dt, chunk_end_dt, params_to_fetch
-                    )
-                    chunk_series = self.weather_repo.extract_param_series(hourly_json)
+                    async with semaphore:
+                        hourly_json = await self.weather_repo.fetch_temporal_data(
+                            request.latitude, request.longitude, request.granularity,
+                            chunk_start_dt, chunk_end_dt, params_to_fetch
+                        )
+                    return self.weather_repo.extract_param_series(hourly_json)
                     
-                    for param, values in chunk_series.items():
-                        if param in all_series:
-                            all_series[param].update(values)
-                            
                 except Exception as e:
                     logger.warning(f"Failed to fetch hourly chunk {year}: {e}")
-                    continue
+                    return {}
+            
+            years = range(start_date_fetch.year, end_date_available.year + 1, request.hourly_chunk_years)
+            chunk_results = await asyncio.gather(*(fetch_chunk(year) for year in years))
+            
+            # Merge in chronological order
+            for chunk_series in chunk_results:
+                for param, values in chunk_series.items():
+                    if param in all_series:
+                        all_series[param].update(values)
+        
+        missing_params = set(params_to_fetch) - {p for p, series in all_series.items() if series}
+        if missing_params:
+            logger.warning(
+                "NASA response missing requested parameters",
+                extra={"missing_parameters": sorted(missing_params)}
+            )
         
         return all_series
     
@@ -191,10 +216,24 @@ class WeatherAnalysisService(IWeatherAnalysisService):
             for i in range(-request.days_before, request.days_after + 1)
         ]
         
+        date_format_api = "%Y%m%d" if request.granularity == Granularity.DAILY else "%Y%m%d%H"
+        now_utc = datetime.now(timezone.utc)
+        
+        # Columnar series are built on first prediction and reused for later days
+        series_arrays: Dict[str, SeriesArrays] = {}
+        
+        def predict(param: str, target_dt_utc: datetime) -> Optional[float]:
+            if param not in series_arrays:
+                series_arrays[param] = series_to_arrays(
+                    all_series.get(param, {}), request.granularity
+                )
+            return predict_from_arrays(
+                series_arrays[param], target_dt_utc, request.granularity, request.window_days
+            )
+        
         for target_dt_utc in datetimes_to_analyze_utc:
-            date_format_api = "%Y%m%d" if request.granularity == Granularity.DAILY else "%Y%m%d%H"
             target_date_str_api = target_dt_utc.strftime(date_format_api)
-            is_in_past = target_dt_utc <= datetime.now(timezone.utc)
+            is_in_past = target_dt_utc <= now_utc
             
             results_for_moment = {}
             
@@ -214,9 +253,7 @@ class WeatherAnalysisService(IWeatherAnalysisService):
                         )
                     else:
                         # Use prediction
-                        predicted_value = predict_with_temporal_regression(
-                            series, target_dt_utc, request.granularity, request.window_days
-                        )
+                        predicted_value = predict(param, target_dt_utc)
                         param_data = WeatherParameter(
                             value=predicted_value,
                             mode=AnalysisMode.PROBABILISTIC,
@@ -225,9 +262,7 @@ class WeatherAnalysisService(IWeatherAnalysisService):
                         )
                 else:
                     # Future prediction
-                    predicted_value = predict_with_temporal_regression(
-                        series, target_dt_utc, request.granularity, request.window_days
-                    )
+                    predicted_value = predict(param, target_dt_utc)
                     param_data = WeatherParameter(
                         value=predicted_value,
                         mode=AnalysisMode.PROBABILISTIC,
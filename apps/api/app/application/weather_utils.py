@@ -2,8 +2,9 @@
 # ABOUTME: Contains functions for heat index, historical statistics, and temporal predictions
 
 import logging
-from datetime import datetime, date, timezone
-from typing import Dict, List, Optional, Any
+from functools import lru_cache
+from datetime import datetime, date
+from typing import Dict, List, Optional, Any, NamedTuple
 import numpy as np
 from scipy.stats import percentileofscore
 from sklearn.linear_model import LinearRegression
@@ -13,6 +14,42 @@ from ..domain.enums import Granularity
 
 logger = logging.getLogger("outdoor_risk_api.weather_utils")
 
+# Decimal places kept in reported statistics (float32 precision is ~7 digits)
+STATS_DECIMALS = 4
+
+# Days per month and days elapsed before each month in a non-leap year
+_MONTH_DAYS = np.array([31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31])
+_DAYS_BEFORE_MONTH = np.concatenate(([0], np.cumsum(_MONTH_DAYS)[:-1]))
+_DAYS_BEFORE_MONTH_TUPLE = tuple(_DAYS_BEFORE_MONTH.tolist())
+
+# Celsius/Fahrenheit conversion factors for the heat index formula
+_C_TO_F_SCALE = 1.8
+_F_TO_C_SCALE = 5.0 / 9.0
+
+
+class SeriesArrays(NamedTuple):
+    """Columnar view of a time series, limited to valid dates and non-missing values."""
+    year: np.ndarray
+    day_of_year: np.ndarray
+    hour: np.ndarray
+    value: np.ndarray
+
+
+def _rothfusz_fahrenheit(t_f, rh):
+    """    
+    Args:
+        t_f: Temperature in Fahrenheit (scalar or array)
+        rh: Relative humidity percentage (scalar or array)
+        
+    Returns:
+        Rothfusz heat index in Fahrenheit
+    """
+    # Horner form of the Rothfusz regression, nested in RH then T
+    c0 = -42.379 + rh * (10.14333127 - 5.481717e-2 * rh)
+    c1 = 2.04901523 + rh * (-0.22475541 + 8.5282e-4 * rh)
+    c2 = -6.83783e-3 + rh * (1.22874e-3 - 1.99e-6 * rh)
+    return c0 + t_f * (c1 + t_f * c2)
+
 
 def calculate_heat_index(temp_c: Optional[float], rh_percent: Optional[float]) -> Optional[float]:
     """    
@@ -23,7 +60,8 @@ def calculate_heat_index(temp_c: Optional[float], rh_percent: Optional[float]) -
     Returns:
         Heat index in Celsius, or None if inputs are invalid
     """
-    if temp_c is None or rh_percent is None or np.isnan(temp_c) or np.isnan(rh_percent):
+    # NaN is the only value not equal to itself; avoids a NumPy ufunc call per scalar
+    if temp_c is None or rh_percent is None or temp_c != temp_c or rh_percent != rh_percent:
         return None
     
     # Heat index only relevant for hot, humid conditions
@@ -31,17 +69,36 @@ def calculate_heat_index(temp_c: Optional[float], rh_percent: Optional[float]) -
         return temp_c
     
     # Convert to Fahrenheit for calculation
-    t_f = temp_c * 9/5 + 32
+    t_f = temp_c * _C_TO_F_SCALE + 32.0
     
-    # Heat index calculation (Rothfusz equation)
-    hi_f = (
-        -42.379 + 2.04901523*t_f + 10.14333127*rh_percent - 0.22475541*t_f*rh_percent 
-        - 6.83783e-3*t_f**2 - 5.481717e-2*rh_percent**2 + 1.22874e-3*t_f**2*rh_percent 
-        + 8.5282e-4*t_f*rh_percent**2 - 1.99e-6*t_f**2*rh_percent**2
-    )
+    hi_f = _rothfusz_fahrenheit(t_f, rh_percent)
     
     # Convert back to Celsius
-    return (hi_f - 32) * 5/9
+    return (hi_f - 32.0) * _F_TO_C_SCALE
+
+
+def calculate_heat_index_array(temp_c: np.ndarray, rh_percent: np.ndarray) -> np.ndarray:
+    """    
+    Args:
+        temp_c: Temperatures in Celsius
+        rh_percent: Relative humidity percentages
+        
+    Returns:
+        Heat index in Celsius for each pair; NaN where either input is missing
+    """
+    temp_c = np.asarray(temp_c, dtype=np.float64)
+    rh_percent = np.asarray(rh_percent, dtype=np.float64)
+    
+    t_f = temp_c * _C_TO_F_SCALE + 32.0
+    
+    hi_f = _rothfusz_fahrenheit(t_f, rh_percent)
+    
+    # Heat index only relevant for hot, humid conditions
+    heat_index = np.where((temp_c < 26.7) | (rh_percent < 40), temp_c, (hi_f - 32.0) * _F_TO_C_SCALE)
+    
+    # Missing humidity must not fall back to the plain temperature
+    heat_index[np.isnan(rh_percent)] = np.nan
+    return heat_index
 
 
 def calculate_historical_stats(all_series: Dict[str, Dict[str, float]]) -> Dict[str, Optional[WeatherStats]]:
@@ -55,26 +112,108 @@ def calculate_historical_stats(all_series: Dict[str, Dict[str, float]]) -> Dict[
     stats_results = {}
     
     for param, series in all_series.items():
-        values = [v for v in series.values() if v is not None]
+        np_values = np.fromiter(
+            (v for v in series.values() if v is not None), dtype=np.float32
+        )
         
-        if not values:
+        if np_values.size == 0:
             stats_results[param] = None
             continue
         
-        np_values = np.array(values, dtype=np.float64)
+        # One sort yields min, max and median without re-scanning the array
+        np_values.sort()
+        count = np_values.size
+        mid = count // 2
+        median = np_values[mid] if count % 2 else (np_values[mid - 1] + np_values[mid]) / 2
         
         stats_results[param] = WeatherStats(
-            count=len(np_values),
-            mean=float(np.mean(np_values)),
-            median=float(np.median(np_values)),
-            min=float(np.min(np_values)),
-            max=float(np.max(np_values)),
-            std=float(np.std(np_values))
+            count=count,
+            mean=round(float(np_values.mean()), STATS_DECIMALS),
+            median=round(float(median), STATS_DECIMALS),
+            min=round(float(np_values[0]), STATS_DECIMALS),
+            max=round(float(np_values[-1]), STATS_DECIMALS),
+            std=round(float(np_values.std()), STATS_DECIMALS)
         )
     
     return stats_results
 
 
+def series_to_arrays(
+    series: Dict[str, float],
+    granularity: Granularity
+) -> SeriesArrays:
+    """    
+    Args:
+        series: Time series keyed by NASA date strings (YYYYMMDD or YYYYMMDDHH)
+        granularity: Data granularity
+        
+    Returns:
+        Year, day-of-year, hour and value arrays for entries with a valid
+        date key and a non-missing value
+    """
+    key_length = 8 if granularity == Granularity.DAILY else 10
+    keys = np.array(list(series.keys()), dtype=str)
+    values = np.array(list(series.values()), dtype=np.float64)
+    
+    try:
+        numeric = keys.astype(np.int64)
+    except ValueError:
+        numeric = np.array([int(k) if k.isdigit() else -1 for k in keys], dtype=np.int64)
+    
+    if granularity == Granularity.DAILY:
+        hour = np.zeros_like(numeric)
+    else:
+        hour = numeric % 100
+        numeric = numeric // 100
+    
+    year = numeric // 10000
+    month = numeric // 100 % 100
+    day = numeric % 100
+    
+    is_leap = (year % 4 == 0) & ((year % 100 != 0) | (year % 400 == 0))
+    month_idx = np.clip(month - 1, 0, 11)
+    days_in_month = _MONTH_DAYS[month_idx] + (is_leap & (month == 2))
+    
+    valid = (
+        (np.char.str_len(keys) == key_length) & (year >= 1)
+        & (month >= 1) & (month <= 12) & (day >= 1) & (day <= days_in_month)
+        & (hour <= 23) & ~np.isnan(values)
+    )
+    day_of_year = _DAYS_BEFORE_MONTH[month_idx] + day + (is_leap & (month > 2))
+    
+    return SeriesArrays(year[valid], day_of_year[valid], hour[valid], values[valid])
+
+
+def day_of_year(d: date) -> int:
+    """    
+    Args:
+        d: Date or datetime
+        
+    Returns:
+        Day of year (1-366), computed without allocating a struct_time
+    """
+    year, month = d.year, d.month
+    is_leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return _DAYS_BEFORE_MONTH_TUPLE[month - 1] + d.day + (is_leap and month > 2)
+
+
+@lru_cache(maxsize=1024)
+def seasonal_window_mask(target_doy: int, window_days: int) -> np.ndarray:
+    """    
+    Args:
+        target_doy: Day of year at the centre of the window
+        window_days: Days on each side of the target to include
+        
+    Returns:
+        Read-only boolean lookup array indexed by day of year (0-366), True
+        inside the window; shared between callers through the cache
+    """
+    mask = np.zeros(367, dtype=bool)
+    mask[(target_doy - 1 + np.arange(-window_days, window_days + 1)) % 365 + 1] = True
+    mask.setflags(write=False)
+    return mask
+
+
 def predict_with_temporal_regression(
     series: Dict[str, float], 
     target_dt: datetime, 
@@ -91,41 +230,46 @@ def predict_with_temporal_regression(
     Returns:
         Predicted value or None if insufficient data
     """
-    target_doy = target_dt.timetuple().tm_yday
-    doy_range = {(target_doy - 1 + i) % 365 + 1 for i in range(-window_days, window_days + 1)}
+    return predict_from_arrays(
+        series_to_arrays(series, granularity), target_dt, granularity, window_days
+    )
+
+
+def predict_from_arrays(
+    arrays: SeriesArrays,
+    target_dt: datetime,
+    granularity: Granularity,
+    window_days: int
+) -> Optional[float]:
+    """    
+    Args:
+        arrays: Historical data series already converted by series_to_arrays
+        target_dt: Target datetime for prediction
+        granularity: Data granularity
+        window_days: Window size for seasonal matching
+        
+    Returns:
+        Predicted value or None if insufficient data
+    """
+    in_season = seasonal_window_mask(day_of_year(target_dt), window_days)
     
-    historical_points = []
-    date_format = "%Y%m%d" if granularity == Granularity.DAILY else "%Y%m%d%H"
+    years, days_of_year, hours, values = arrays
     
-    for date_str, value in series.items():
-        if value is None:
-            continue
-        
-        try:
-            d = datetime.strptime(date_str, date_format).replace(tzinfo=timezone.utc)
-            is_in_day_window = d.timetuple().tm_yday in doy_range
-            is_correct_hour = True if granularity == Granularity.DAILY else d.hour == target_dt.hour
-            
-            if is_in_day_window and is_correct_hour:
-                historical_points.append((d.year, float(value)))
-                
-        except (ValueError, TypeError):
-            continue
+    in_window = in_season[days_of_year]
+    if granularity != Granularity.DAILY:
+        in_window &= hours == target_dt.hour
     
-    if not historical_points:
+    if not in_window.any():
         return None
     
     # Group by year and average multiple observations
-    yearly_data = {}
-    for year, value in historical_points:
-        if year not in yearly_data:
-            yearly_data[year] = []
-        yearly_data[year].append(value)
-    
-    X_train_list, y_train_list = [], []
-    for year, values in sorted(yearly_data.items()):
-        X_train_list.append(year)
-        y_train_list.append(np.mean(values))
+    unique_years, year_idx = np.unique(years[in_window], return_inverse=True)
+    yearly_means = (
+        np.bincount(year_idx, weights=values[in_window]) / np.bincount(year_idx)
+    )
+    
+    X_train_list = unique_years.tolist()
+    y_train_list = yearly_means.tolist()
     
     if len(X_train_list) < 2:
         return np.mean(y_train_list) if y_train_list else None
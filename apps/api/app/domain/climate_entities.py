@@ -2,11 +2,13 @@
 # ABOUTME: Contains core business objects for renewable energy potential assessment
 
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class LocationInput(BaseModel):
     """Input model for location with coordinates."""
+    model_config = ConfigDict(strict=True)
+    
     latitude: float = Field(..., ge=-90, le=90, description="Latitude coordinate")
     longitude: float = Field(..., ge=-180, le=180, description="Longitude coordinate")
 
@@ -26,6 +28,8 @@ class LocationResult(BaseModel):
 
 class AnalysisMeta(BaseModel):
     """Metadata for the analysis process."""
+    model_config = ConfigDict(defer_build=True)
+    
     timestamp_utc: str
     processing_time_seconds: float
     locations_processed: int
@@ -34,12 +38,16 @@ class AnalysisMeta(BaseModel):
 
 class LocationError(BaseModel):
     """Error information for failed location processing."""
+    model_config = ConfigDict(defer_build=True)
+    
     location: LocationInput
     error: str
 
 
 class ClimateEnergyAnalysisResult(BaseModel):
     """Complete climate energy analysis result."""
+    model_config = ConfigDict(defer_build=True)
+    
     meta: AnalysisMeta
     data: List[LocationResult]
     errors: List[LocationError]
@@ -47,10 +55,10 @@ class ClimateEnergyAnalysisResult(BaseModel):
 
 class ClimateEnergyAnalysisRequest(BaseModel):
     """Request for climate energy analysis."""
-    locations: List[LocationInput] = Field(..., min_items=1, max_items=5, description="List of locations to analyze")
-    
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        defer_build=True,
+        json_schema_extra={
             "example": {
                 "locations": [
                     {"latitude": -7.1195, "longitude": -34.8451},
@@ -58,17 +66,22 @@ class ClimateEnergyAnalysisRequest(BaseModel):
                 ]
             }
         }
+    )
+    
+    locations: List[LocationInput] = Field(..., min_length=1, max_length=5, description="List of locations to analyze")
 
 
 class SingleLocationRequest(BaseModel):
     """Request for single location climate energy analysis."""
-    latitude: float = Field(..., ge=-90, le=90, description="Latitude coordinate")
-    longitude: float = Field(..., ge=-180, le=180, description="Longitude coordinate")
-    
-    class Config:
-        schema_extra = {
+    model_config = ConfigDict(
+        strict=True,
+        json_schema_extra={
             "example": {
                 "latitude": -7.1195,
                 "longitude": -34.8451
             }
-        }
\ No newline at end of file
+        }
+    )
+    
+    latitude: float = Field(..., ge=-90, le=90, description="Latitude coordinate")
+    longitude: float = Field(..., ge=-180, le=180, description="Longitude coordinate")
\ No newline at end of file
@@ -31,7 +31,21 @@ HOURLY_UNAVAILABLE_PARAMS = {
     "T2M_MAX", "T2M_MIN", "IMERG_PRECTOT", "CLOUD_AMT"
 }
 
+# Maximum hourly chunk requests in flight per analysis
+HOURLY_CHUNK_CONCURRENCY = 4
+
 # HTTP Client Configuration
 DEFAULT_RETRIES = 4
 DEFAULT_TIMEOUT = 120
-RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
\ No newline at end of file
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+CONNECT_RETRIES = 2  # Connection-level retries handled by the httpx transport
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+KEEPALIVE_EXPIRY = 300  # Seconds an idle pooled connection is kept open
+
+# NASA POWER response cache (historical data only changes as recent days are backfilled)
+RESPONSE_CACHE_TTL_SECONDS = 6 * 60 * 60
+RESPONSE_CACHE_MAX_ENTRIES = 16  # Daily/climatology responses only; hourly chunks are not cached
+
+# Climate-energy climatology is averaged over a fixed year range, so entries never go stale
+CLIMATOLOGY_CACHE_MAX_ENTRIES = 1024
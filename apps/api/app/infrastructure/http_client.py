@@ -5,17 +5,49 @@ import time
 import random
 import logging
 import asyncio
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import httpx
+import orjson
+from .config import (
+    DEFAULT_RETRIES, DEFAULT_TIMEOUT, RETRY_STATUS_CODES, CONNECT_RETRIES,
+    MAX_CONNECTIONS, MAX_KEEPALIVE_CONNECTIONS, KEEPALIVE_EXPIRY
+)
 
 
 logger = logging.getLogger("outdoor_risk_api.http_client")
 
+# Errors the transport retries CONNECT_RETRIES times before they surface
+CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
 
 class HTTPClient:    
-    def __init__(self, retries: int = 4, timeout: int = 120):
+    def __init__(self, retries: int = DEFAULT_RETRIES, timeout: int = DEFAULT_TIMEOUT):
         self.retries = retries
         self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared connection pool, opened on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=CONNECT_RETRIES,
+                    limits=httpx.Limits(
+                        max_connections=MAX_CONNECTIONS,
+                        max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                        keepalive_expiry=KEEPALIVE_EXPIRY
+                    )
+                )
+            )
+        return self._client
+    
+    async def aclose(self) -> None:
+        """Close the shared connection pool."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
         
     async def get(self, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """        
@@ -29,49 +61,49 @@ class HTTPClient:
         Raises:
             httpx.HTTPError: On non-retryable errors or max retries exceeded
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            for attempt in range(self.retries):
-                try:
-                    logger.info(
-                        f"Making HTTP request (attempt {attempt + 1})",
-                        extra={"url": url, "params": params}
-                    )
-                    
-                    response = await client.get(url, params=params)
-                    response.raise_for_status()
-                    
-                    logger.info(
-                        f"HTTP request successful",
-                        extra={"status_code": response.status_code}
+        for attempt in range(self.retries):
+            try:
+                logger.info(
+                    f"Making HTTP request (attempt {attempt + 1})",
+                    extra={"url": url, "params": params}
+                )
+                
+                response = await self.client.get(url, params=params)
+                response.raise_for_status()
+                
+                logger.info(
+                    f"HTTP request successful",
+                    extra={"status_code": response.status_code}
+                )
+                
+                return orjson.loads(response.content)
+                
+            except httpx.HTTPError as e:
+                # Connect failures were already retried by the transport
+                is_retryable = not isinstance(e, CONNECT_ERRORS) and (
+                    not hasattr(e, 'response') or
+                    e.response is None or
+                    e.response.status_code in RETRY_STATUS_CODES
+                )
+                
+                logger.warning(
+                    f"HTTP request failed (attempt {attempt + 1})",
+                    extra={
+                        "error": str(e),
+                        "is_retryable": is_retryable,
+                        "url": url
+                    }
+                )
+                
+                if attempt == self.retries - 1 or not is_retryable:
+                    logger.error(
+                        "HTTP request failed after all retries",
+                        extra={"error": str(e), "url": url}
                     )
+                    raise e
                     
-                    return response.json()
-                    
-                except httpx.HTTPError as e:
-                    is_retryable = (
-                        not hasattr(e, 'response') or
-                        e.response is None or
-                        e.response.status_code in {429, 500, 502, 503, 504}
-                    )
-                    
-                    logger.warning(
-                        f"HTTP request failed (attempt {attempt + 1})",
-                        extra={
-                            "error": str(e),
-                            "is_retryable": is_retryable,
-                            "url": url
-                        }
-                    )
-                    
-                    if attempt == self.retries - 1 or not is_retryable:
-                        logger.error(
-                            "HTTP request failed after all retries",
-                            extra={"error": str(e), "url": url}
-                        )
-                        raise e
-                        
-                    # Exponential backoff with jitter
-                    sleep_time = (2 ** attempt) * random.uniform(0.8, 1.2)
-                    await asyncio.sleep(sleep_time)
-                    
+                # Exponential backoff with jitter
+                sleep_time = (2 ** attempt) * random.uniform(0.8, 1.2)
+                await asyncio.sleep(sleep_time)
+                
         raise RuntimeError("Maximum retry attempts exceeded")
\ No newline at end of file
@@ -6,17 +6,23 @@ import random
 import time
 from typing import List, Dict, Any
 import httpx
+import orjson
 from ..domain.climate_interfaces import INASAClimateRepository
+from .config import RETRY_STATUS_CODES, CLIMATOLOGY_CACHE_MAX_ENTRIES
+from .http_client import HTTPClient, CONNECT_ERRORS
+from .response_cache import ResponseCache
 
 
 class NASAClimateRepository(INASAClimateRepository):    
-    def __init__(self):
+    def __init__(self, http_client: HTTPClient):
+        self.http_client = http_client
         self.base_url = "https://power.larc.nasa.gov/api/temporal/climatology/point"
         self.community = "RE"
         self.start_year = "2010"
         self.end_year = "2024"
         self.timeout = 45
         self.retries = 4
+        self._climatology_cache = ResponseCache(CLIMATOLOGY_CACHE_MAX_ENTRIES)
     
     async def fetch_climatology_data(
         self,
@@ -36,6 +42,21 @@ class NASAClimateRepository(INASAClimateRepository):
         Raises:
             httpx.HTTPError: If request fails after all retries
         """
+        cache_key = (lat, lon, tuple(params_list))
+        return await self._climatology_cache.get_or_fetch(
+            cache_key, lambda: self._fetch_parameters(lat, lon, params_list)
+        )
+    
+    async def _fetch_parameters(self, lat: float, lon: float, params_list: List[str]) -> Dict[str, Any]:
+        """        
+        Args:
+            lat: Latitude coordinate
+            lon: Longitude coordinate
+            params_list: List of parameters to request from the API
+            
+        Returns:
+            Parameter data from the API response, empty if it carried none
+        """
         payload = {
             "start": self.start_year,
             "end": self.end_year,
@@ -62,17 +83,19 @@ class NASAClimateRepository(INASAClimateRepository):
         Raises:
             httpx.HTTPError: If request fails after all retries
         """
-        async with httpx.AsyncClient() as client:
-            for attempt in range(self.retries):
-                try:
-                    response = await client.get(url, params=params, timeout=self.timeout)
-                    response.raise_for_status()
-                    return response.json()
-                except httpx.HTTPError as e:
-                    status_code = e.response.status_code if e.response else 'N/A'
-                    is_retryable = status_code in (429, 500, 502, 503, 504)
-                    if not is_retryable or attempt == self.retries - 1:
-                        raise e
-                    await asyncio.sleep((2 ** attempt) * random.uniform(0.8, 1.2))
-            
-            raise RuntimeError("Maximum request attempts exceeded.")
\ No newline at end of file
+        for attempt in range(self.retries):
+            try:
+                response = await self.http_client.client.get(url, params=params, timeout=self.timeout)
+                response.raise_for_status()
+                return orjson.loads(response.content)
+            except httpx.HTTPError as e:
+                # Connect failures were already retried by the transport
+                is_retryable = not isinstance(e, CONNECT_ERRORS) and (
+                    not isinstance(e, httpx.HTTPStatusError) or
+                    e.response.status_code in RETRY_STATUS_CODES
+                )
+                if not is_retryable or attempt == self.retries - 1:
+                    raise e
+                await asyncio.sleep((2 ** attempt) * random.uniform(0.8, 1.2))
+        
+        raise RuntimeError("Maximum request attempts exceeded.")
\ No newline at end of file
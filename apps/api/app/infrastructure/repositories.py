@@ -6,16 +6,47 @@ from datetime import date
 from typing import Dict, List, Any, Optional
 from ..domain.interfaces import IWeatherDataRepository
 from ..domain.enums import Granularity
-from .config import BASE_URL, API_PATHS, DEFAULT_COMMUNITY
+from .config import (
+    BASE_URL, API_PATHS, DEFAULT_COMMUNITY, RESPONSE_CACHE_TTL_SECONDS, RESPONSE_CACHE_MAX_ENTRIES
+)
 from .http_client import HTTPClient
+from .response_cache import ResponseCache
 
 
 logger = logging.getLogger("outdoor_risk_api.nasa_repository")
 
+# Month keys used by NASA POWER climatology responses
+MONTH_ABBREVIATIONS = {
+    "JAN": 1, "FEB": 2, "MAR": 3, "APR": 4, "MAY": 5, "JUN": 6,
+    "JUL": 7, "AUG": 8, "SEP": 9, "OCT": 10, "NOV": 11, "DEC": 12
+}
+
 
 class NASAWeatherDataRepository(IWeatherDataRepository):    
     def __init__(self, http_client: HTTPClient):
         self.http_client = http_client
+        self._response_cache = ResponseCache(RESPONSE_CACHE_MAX_ENTRIES, RESPONSE_CACHE_TTL_SECONDS)
+    
+    async def _cached_get(self, url: str, params: Dict[str, Any], store: bool = True) -> Dict[str, Any]:
+        """        
+        Args:
+            url: Request URL
+            params: Query parameters
+            store: Whether to keep the response in memory after it arrives
+            
+        Returns:
+            Raw API response, served from memory while younger than the cache TTL
+        """
+        key = (url, tuple(sorted(params.items())))
+        
+        cached = self._response_cache.get(key)
+        if cached is not None:
+            logger.info("Serving NASA API response from cache", extra={"url": url})
+            return cached
+        
+        return await self._response_cache.get_or_fetch(
+            key, lambda: self.http_client.get(url, params), store=store
+        )
     
     async def fetch_temporal_data(
         self,
@@ -67,7 +98,8 @@ class NASAWeatherDataRepository(IWeatherDataRepository):
             }
         )
         
-        return await self.http_client.get(url, params)
+        # Decoded hourly chunks run to tens of MB each, so only daily responses are kept
+        return await self._cached_get(url, params, store=granularity != Granularity.HOURLY)
     
     async def fetch_climatology(
         self,
@@ -104,7 +136,7 @@ class NASAWeatherDataRepository(IWeatherDataRepository):
             }
         )
         
-        return await self.http_client.get(url, params)
+        return await self._cached_get(url, params)
     
     def extract_param_series(self, json_obj: Dict[str, Any]) -> Dict[str, Dict[str, float]]:
         """        
@@ -114,16 +146,15 @@ class NASAWeatherDataRepository(IWeatherDataRepository):
         Returns:
             Dictionary mapping parameters to their time series data
         """
-        try:
-            params = json_obj.get("properties", {}).get("parameter", {})
-            for param, series in params.items():
-                for date_key, value in series.items():
-                    if value == -999:
-                        series[date_key] = None
-            return params
-        except KeyError as e:
-            logger.error(f"Error extracting parameter series: {e}")
-            return {}
+        params = json_obj.get("properties", {}).get("parameter", {})
+        # Build fresh dicts so cached raw responses are never modified
+        return {
+            param: {
+                date_key: None if value == -999 else value
+                for date_key, value in series.items()
+            }
+            for param, series in params.items()
+        }
     
     def extract_climatology_monthly(self, json_obj: Dict[str, Any]) -> Dict[str, Dict[int, float]]:
         """        
@@ -133,8 +164,6 @@ class NASAWeatherDataRepository(IWeatherDataRepository):
         Returns:
             Dictionary mapping parameters to monthly averages
         """
-        import datetime as dt
-        
         param_series = self.extract_param_series(json_obj)
         result = {}
         
@@ -143,11 +172,8 @@ class NASAWeatherDataRepository(IWeatherDataRepository):
             for month_key, value in monthly_data.items():
                 if month_key.isdigit() and 1 <= int(month_key) <= 12:
                     month_num = int(month_key)
-                elif len(month_key) == 3 and month_key.isalpha() and month_key != "ANN":
-                    try:
-                        month_num = dt.datetime.strptime(month_key, "%b").month
-                    except ValueError:
-                        continue
+                elif month_key.upper() in MONTH_ABBREVIATIONS:
+                    month_num = MONTH_ABBREVIATIONS[month_key.upper()]
                 else:
                     continue
                 
@@ -0,0 +1,105 @@
+# ABOUTME: Bounded in-memory cache for NASA POWER responses shared by the repositories
+# ABOUTME: Expires entries by TTL, evicts the oldest past a cap and shares in-flight fetches
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class _InFlightFetch:
+    """Upstream fetch shared by every caller waiting on the same key."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: "asyncio.Task[Any]"):
+        self.task = task
+        self.waiters = 0
+
+
+class ResponseCache:
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, _InFlightFetch] = {}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Args:
+            key: Cache key
+
+        Returns:
+            Stored value, or None when missing or older than the TTL
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        stored_at, value = entry
+        if self.ttl_seconds is not None and time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Args:
+            key: Cache key
+            value: Value to store; refreshes the entry's age if already present
+        """
+        self._entries.pop(key, None)
+        self._entries[key] = (time.monotonic(), value)
+        if len(self._entries) > self.max_entries:
+            # Dicts keep insertion order, so the first key is the oldest entry
+            del self._entries[next(iter(self._entries))]
+
+    async def get_or_fetch(
+        self,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        store: bool = True
+    ) -> Any:
+        """
+        Args:
+            key: Cache key
+            fetch: Coroutine factory that retrieves the value on a miss
+            store: Whether to keep a non-empty fetched value for later calls
+
+        Returns:
+            Cached value, or the result of the fetch shared with concurrent callers
+
+        Raises:
+            Exception: Whatever the fetch raised, delivered to every waiting caller
+        """
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        inflight = self._inflight.get(key)
+        if inflight is None:
+            inflight = _InFlightFetch(asyncio.ensure_future(fetch()))
+            self._inflight[key] = inflight
+            inflight.task.add_done_callback(
+                lambda task: self._finish_fetch(key, inflight, store)
+            )
+
+        inflight.waiters += 1
+        try:
+            # Shielded so one cancelled caller does not abort the fetch for the others
+            return await asyncio.shield(inflight.task)
+        finally:
+            inflight.waiters -= 1
+            if inflight.waiters == 0 and not inflight.task.done():
+                # The last caller went away, so nobody needs the result
+                inflight.task.cancel()
+
+    def _finish_fetch(self, key: Hashable, inflight: _InFlightFetch, store: bool) -> None:
+        """Store a successful fetch and stop sharing it."""
+        if self._inflight.get(key) is inflight:
+            del self._inflight[key]
+
+        if inflight.task.cancelled():
+            return
+        # Retrieving the exception keeps asyncio from reporting it as unhandled
+        if inflight.task.exception() is None and store and inflight.task.result():
+            self.put(key, inflight.task.result())
@@ -4,6 +4,7 @@
 import uuid
 import time
 import logging
+from contextlib import asynccontextmanager
 from typing import Callable
 from fastapi import FastAPI, Request, Response, HTTPException
 from fastapi.exception_handlers import http_exception_handler
@@ -11,7 +12,8 @@ from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.base import BaseHTTPMiddleware
 from pythonjsonlogger import jsonlogger
-from .presentation import weather_router, climate_router, WeatherAnalysisException
+from .presentation import weather_router, climate_router, get_container, WeatherAnalysisException
+from .presentation.request_context import request_id_ctx
 
 
 class RequestIDMiddleware(BaseHTTPMiddleware):
@@ -23,7 +25,8 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
         if not request_id:
             request_id = str(uuid.uuid4())
         
-        # Store request ID in request state for logging
+        # Expose request ID to route handlers (context) and exception handlers (state)
+        request_id_ctx.set(request_id)
         request.state.request_id = request_id
         
         # Process request
@@ -71,6 +74,13 @@ def setup_logging():
         uvicorn_logger.handlers[0].setFormatter(formatter)
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared NASA POWER connection pool on shutdown."""
+    yield
+    await get_container().http_client.aclose()
+
+
 # Setup logging
 setup_logging()
 
@@ -80,7 +90,8 @@ app = FastAPI(
     version="1.0.0",
     description="NASA Hackathon 2025 - Weather Risk Assessment & Renewable Energy Potential API using NASA POWER data",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -4,7 +4,7 @@
 import logging
 from datetime import datetime
 from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status
 import httpx
 from ..domain.climate_entities import (
     ClimateEnergyAnalysisRequest, 
@@ -15,6 +15,7 @@ from ..domain.climate_entities import (
 from ..domain.climate_interfaces import IClimateEnergyService
 from .dependencies import get_climate_container
 from .models import ValidationException, ExternalServiceException
+from .request_context import request_id_ctx
 
 
 logger = logging.getLogger("outdoor_risk_api.climate_routes")
@@ -26,17 +27,16 @@ def get_climate_service() -> IClimateEnergyService:
     return container.climate_service
 
 
-@router.post("/analyze", response_model=LocationResult)
-async def analyze_single_location(
-    request: SingleLocationRequest,
-    climate_service: IClimateEnergyService = Depends(get_climate_service),
-    http_request: Request = None
+async def _analyze_location(
+    latitude: float,
+    longitude: float,
+    climate_service: IClimateEnergyService
 ) -> LocationResult:
     """
     Args:
-        request: Single location request with latitude and longitude
-        climate_service: Injected climate energy analysis service
-        http_request: FastAPI request object for logging
+        latitude: Validated latitude coordinate
+        longitude: Validated longitude coordinate
+        climate_service: Climate energy analysis service
         
     Returns:
         Complete climate energy analysis result for the location
@@ -44,29 +44,26 @@ async def analyze_single_location(
     Raises:
         HTTPException: For validation errors (400) or service errors (502)
     """
-    request_id = getattr(http_request.state, 'request_id', 'unknown') if http_request else 'unknown'
+    request_id = request_id_ctx.get()
     
     logger.info(
         "Single location climate energy analysis request received",
         extra={
             "request_id": request_id,
-            "latitude": request.latitude,
-            "longitude": request.longitude
+            "latitude": latitude,
+            "longitude": longitude
         }
     )
     
     try:
-        result = await climate_service.analyze_single_location(
-            request.latitude, 
-            request.longitude
-        )
+        result = await climate_service.analyze_single_location(latitude, longitude)
         
         logger.info(
             "Single location climate energy analysis completed successfully",
             extra={
                 "request_id": request_id,
-                "latitude": request.latitude,
-                "longitude": request.longitude
+                "latitude": latitude,
+                "longitude": longitude
             }
         )
         
@@ -98,6 +95,25 @@ async def analyze_single_location(
         )
 
 
+@router.post("/analyze", response_model=LocationResult)
+async def analyze_single_location(
+    request: SingleLocationRequest,
+    climate_service: IClimateEnergyService = Depends(get_climate_service)
+) -> LocationResult:
+    """
+    Args:
+        request: Single location request with latitude and longitude
+        climate_service: Injected climate energy analysis service
+        
+    Returns:
+        Complete climate energy analysis result for the location
+        
+    Raises:
+        HTTPException: For validation errors (400) or service errors (502)
+    """
+    return await _analyze_location(request.latitude, request.longitude, climate_service)
+
+
 @router.get("/health")
 async def climate_health() -> Dict[str, Any]:
     """
@@ -155,15 +171,13 @@ async def get_climate_parameters() -> Dict[str, Any]:
 async def analyze_location_by_coordinates(
     latitude: float,
     longitude: float,
-    climate_service: IClimateEnergyService = Depends(get_climate_service),
-    http_request: Request = None
+    climate_service: IClimateEnergyService = Depends(get_climate_service)
 ) -> LocationResult:
     """    
     Args:
         latitude: Latitude coordinate (-90 to 90)
         longitude: Longitude coordinate (-180 to 180)
         climate_service: Injected climate energy analysis service
-        http_request: FastAPI request object for logging
         
     Returns:
         Climate energy analysis result for the location
@@ -173,6 +187,4 @@ async def analyze_location_by_coordinates(
     if not (-180 <= longitude <= 180):
         raise ValidationException("Longitude must be between -180 and 180")
     
-    request = SingleLocationRequest(latitude=latitude, longitude=longitude)
-    
-    return await analyze_single_location(request, climate_service, http_request)
\ No newline at end of file
+    return await _analyze_location(latitude, longitude, climate_service)
\ No newline at end of file
@@ -1,7 +1,7 @@
 # ABOUTME: Dependency injection container for application services and repositories
 # ABOUTME: Provides singleton instances and proper dependency wiring for clean architecture
 
-from functools import lru_cache
+from dataclasses import dataclass
 from ..domain.interfaces import IWeatherDataRepository, IWeatherAnalysisService
 from ..domain.climate_interfaces import INASAClimateRepository, IClimateEnergyService
 from ..infrastructure import HTTPClient, NASAWeatherDataRepository
@@ -10,65 +10,49 @@ from ..application import WeatherAnalysisService
 from ..application.climate_energy_service import ClimateEnergyService
 
 
+@dataclass(slots=True, frozen=True)
 class Container:
     """Dependency injection container for application services."""
     
-    def __init__(self):
-        self._http_client = None
-        self._weather_repo = None
-        self._weather_service = None
+    http_client: HTTPClient
+    weather_repository: IWeatherDataRepository
+    weather_service: IWeatherAnalysisService
     
-    @property
-    def http_client(self) -> HTTPClient:
-        """Get HTTP client instance."""
-        if self._http_client is None:
-            self._http_client = HTTPClient()
-        return self._http_client
-    
-    @property
-    def weather_repository(self) -> IWeatherDataRepository:
-        """Get weather data repository instance."""
-        if self._weather_repo is None:
-            self._weather_repo = NASAWeatherDataRepository(self.http_client)
-        return self._weather_repo
-    
-    @property
-    def weather_service(self) -> IWeatherAnalysisService:
-        """Get weather analysis service instance."""
-        if self._weather_service is None:
-            self._weather_service = WeatherAnalysisService(self.weather_repository)
-        return self._weather_service
+    @classmethod
+    def build(cls, http_client: HTTPClient) -> "Container":
+        """Wire the weather analysis dependency graph."""
+        weather_repository = NASAWeatherDataRepository(http_client)
+        weather_service = WeatherAnalysisService(weather_repository)
+        return cls(http_client, weather_repository, weather_service)
 
 
+@dataclass(slots=True, frozen=True)
 class ClimateContainer:
     """Dependency injection container for climate energy analysis services."""
     
-    def __init__(self):
-        self._nasa_climate_repo = None
-        self._climate_service = None
-    
-    @property
-    def nasa_climate_repository(self) -> INASAClimateRepository:
-        """Get NASA climate repository instance."""
-        if self._nasa_climate_repo is None:
-            self._nasa_climate_repo = NASAClimateRepository()
-        return self._nasa_climate_repo
+    http_client: HTTPClient
+    nasa_climate_repository: INASAClimateRepository
+    climate_service: IClimateEnergyService
     
-    @property
-    def climate_service(self) -> IClimateEnergyService:
-        """Get climate energy analysis service instance."""
-        if self._climate_service is None:
-            self._climate_service = ClimateEnergyService(self.nasa_climate_repository)
-        return self._climate_service
+    @classmethod
+    def build(cls, http_client: HTTPClient) -> "ClimateContainer":
+        """Wire the climate energy analysis dependency graph."""
+        nasa_climate_repository = NASAClimateRepository(http_client)
+        climate_service = ClimateEnergyService(nasa_climate_repository)
+        return cls(http_client, nasa_climate_repository, climate_service)
+
+
+# Both containers share one HTTP client so NASA POWER calls reuse a single connection pool
+_HTTP_CLIENT = HTTPClient()
+_CONTAINER = Container.build(_HTTP_CLIENT)
+_CLIMATE_CONTAINER = ClimateContainer.build(_HTTP_CLIENT)
 
 
-@lru_cache()
 def get_container() -> Container:
     """Get singleton container instance."""
-    return Container()
+    return _CONTAINER
 
 
-@lru_cache()
 def get_climate_container() -> ClimateContainer:
     """Get singleton climate container instance."""
-    return ClimateContainer()
\ No newline at end of file
+    return _CLIMATE_CONTAINER
\ No newline at end of file
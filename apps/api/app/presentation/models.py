@@ -2,12 +2,14 @@
 # ABOUTME: Defines response schemas and exception handling for clean API contracts
 
 from typing import Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from fastapi import HTTPException, status
 
 
 class APIResponse(BaseModel):
     """Standard API response wrapper."""
+    model_config = ConfigDict(defer_build=True)
+    
     success: bool
     message: Optional[str] = None
     data: Optional[dict] = None
@@ -15,6 +17,8 @@ class APIResponse(BaseModel):
 
 class ErrorResponse(BaseModel):
     """Error response model."""
+    model_config = ConfigDict(defer_build=True)
+    
     success: bool = False
     error: str
     details: Optional[str] = None
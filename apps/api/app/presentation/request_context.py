@@ -0,0 +1,7 @@
+# ABOUTME: Request-scoped context shared by middleware and route handlers
+# ABOUTME: Exposes the current request ID without injecting the Request object
+
+from contextvars import ContextVar
+
+
+request_id_ctx: ContextVar[str] = ContextVar("request_id", default="unknown")
@@ -4,16 +4,39 @@
 import logging
 from datetime import datetime
 from typing import Dict, Any
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import ValidationError
 import httpx
 from ..domain.entities import WeatherAnalysisRequest, WeatherAnalysisResult
 from ..domain.interfaces import IWeatherAnalysisService
+from ..infrastructure.config import DEFAULT_PARAMS, CLIMATOLOGY_PARAMS, HOURLY_UNAVAILABLE_PARAMS
 from .dependencies import get_container
 from .models import APIResponse, ValidationException, ExternalServiceException
+from .request_context import request_id_ctx
 
 
 logger = logging.getLogger("outdoor_risk_api.weather_routes")
+
+# Static parameter catalogue served by /weather/parameters
+PARAMETERS_RESPONSE: Dict[str, Any] = {
+    "default_parameters": list(DEFAULT_PARAMS),
+    "climatology_parameters": list(CLIMATOLOGY_PARAMS),
+    "hourly_unavailable": sorted(HOURLY_UNAVAILABLE_PARAMS),
+    "parameter_descriptions": {
+        "T2M": "Temperature at 2 Meters (°C)",
+        "T2M_MAX": "Maximum Temperature at 2 Meters (°C) - Daily only",
+        "T2M_MIN": "Minimum Temperature at 2 Meters (°C) - Daily only", 
+        "PRECTOTCORR": "Precipitation Corrected (mm/day or mm/hour)",
+        "IMERG_PRECTOT": "IMERG Precipitation Total (mm/day) - Daily only",
+        "RH2M": "Relative Humidity at 2 Meters (%)",
+        "WS10M": "Wind Speed at 10 Meters (m/s)",
+        "CLOUD_AMT": "Cloud Amount (%) - Daily only",
+        "FRSNO": "Snow Fraction (%)",
+        "ALLSKY_SFC_SW_DWN": "All Sky Surface Shortwave Downward Irradiance (kW-hr/m²/day)"
+    },
+    "granularity_options": ["daily", "hourly"]
+}
+
 router = APIRouter(prefix="/weather", tags=["weather"])
 
 
@@ -26,14 +49,12 @@ def get_weather_service() -> IWeatherAnalysisService:
 @router.post("/analyze", response_model=WeatherAnalysisResult)
 async def analyze_weather_range(
     request: WeatherAnalysisRequest,
-    weather_service: IWeatherAnalysisService = Depends(get_weather_service),
-    http_request: Request = None
+    weather_service: IWeatherAnalysisService = Depends(get_weather_service)
 ) -> WeatherAnalysisResult:
     """
     Args:
         request: Weather analysis request parameters
         weather_service: Injected weather analysis service
-        http_request: FastAPI request object for logging
         
     Returns:
         Complete weather analysis results with risk assessments
@@ -41,7 +62,7 @@ async def analyze_weather_range(
     Raises:
         HTTPException: For validation errors (400) or service errors (502)
     """
-    request_id = getattr(http_request.state, 'request_id', 'unknown') if http_request else 'unknown'
+    request_id = request_id_ctx.get()
     
     logger.info(
         "Weather analysis request received",
@@ -118,25 +139,4 @@ async def get_available_parameters() -> Dict[str, Any]:
     Returns:
         Dictionary of available weather parameters with descriptions
     """
-    from ..infrastructure.config import DEFAULT_PARAMS, CLIMATOLOGY_PARAMS, HOURLY_UNAVAILABLE_PARAMS
-    
-    parameter_descriptions = {
-        "T2M": "Temperature at 2 Meters (°C)",
-        "T2M_MAX": "Maximum Temperature at 2 Meters (°C) - Daily only",
-        "T2M_MIN": "Minimum Temperature at 2 Meters (°C) - Daily only", 
-        "PRECTOTCORR": "Precipitation Corrected (mm/day or mm/hour)",
-        "IMERG_PRECTOT": "IMERG Precipitation Total (mm/day) - Daily only",
-        "RH2M": "Relative Humidity at 2 Meters (%)",
-        "WS10M": "Wind Speed at 10 Meters (m/s)",
-        "CLOUD_AMT": "Cloud Amount (%) - Daily only",
-        "FRSNO": "Snow Fraction (%)",
-        "ALLSKY_SFC_SW_DWN": "All Sky Surface Shortwave Downward Irradiance (kW-hr/m²/day)"
-    }
-    
-    return {
-        "default_parameters": DEFAULT_PARAMS,
-        "climatology_parameters": CLIMATOLOGY_PARAMS,
-        "hourly_unavailable": list(HOURLY_UNAVAILABLE_PARAMS),
-        "parameter_descriptions": parameter_descriptions,
-        "granularity_options": ["daily", "hourly"]
-    }
\ No newline at end of file
+    return PARAMETERS_RESPONSE
\ No newline at end of file
@@ -189,18 +189,20 @@ async def main():
     print("Weather Risk Assessment API - Examples")
     print("=" * 50)
     
-    # Daily analysis example
-    daily_result = await example_daily_analysis()
+    # The examples are independent requests, so run them concurrently
+    # (their progress output may interleave)
+    daily_result, hourly_result, stats_result = await asyncio.gather(
+        example_daily_analysis(),
+        example_hourly_analysis(),
+        example_statistics_analysis()
+    )
+    
     if daily_result:
         save_example_results(daily_result, "daily_analysis_example.json")
     
-    # Hourly analysis example  
-    hourly_result = await example_hourly_analysis()
     if hourly_result:
         save_example_results(hourly_result, "hourly_analysis_example.json")
     
-    # Statistics example
-    stats_result = await example_statistics_analysis()
     if stats_result:
         save_example_results(stats_result, "statistics_example.json")
     
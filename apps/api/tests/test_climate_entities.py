@@ -0,0 +1,31 @@
+# ABOUTME: Unit tests for climate energy request models
+# ABOUTME: Validates strict coordinate parsing and handling of unknown fields
+
+import pytest
+from pydantic import ValidationError
+from app.domain.climate_entities import SingleLocationRequest, ClimateEnergyAnalysisRequest
+
+
+class TestClimateRequestModels:
+    """Test suite for climate energy request validation."""
+
+    def test_single_location_accepts_numeric_coordinates(self):
+        """Test that JSON numbers (including integers) are accepted."""
+        request = SingleLocationRequest.model_validate({"latitude": -7, "longitude": -34.8451})
+        assert request.latitude == -7.0
+        assert request.longitude == -34.8451
+
+    def test_single_location_rejects_string_coordinates(self):
+        """Test that strict mode does not coerce strings to floats."""
+        with pytest.raises(ValidationError):
+            SingleLocationRequest.model_validate({"latitude": "-7.1", "longitude": -34.8})
+
+    def test_single_location_ignores_unknown_fields(self):
+        """Test that unexpected keys are dropped rather than rejected."""
+        request = SingleLocationRequest.model_validate({"latitude": -7.1, "longitude": -34.8, "zoom": 4})
+        assert not hasattr(request, "zoom")
+
+    def test_batch_request_validates_nested_locations(self):
+        """Test that nested locations follow the same strict rules."""
+        with pytest.raises(ValidationError):
+            ClimateEnergyAnalysisRequest.model_validate({"locations": [{"latitude": "1", "longitude": 2}]})
@@ -2,25 +2,29 @@
 # ABOUTME: Validates API status responses and request ID injection functionality
 
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
-from app.main import app
+from app.main import app, RequestIDMiddleware
+from app.presentation.request_context import request_id_ctx
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Share one test client across the module."""
+    return TestClient(app)
 
 
 class TestHealthEndpoint:
     """Test suite for the /health endpoint."""
     
-    def setup_method(self):
-        """Set up test client for each test."""
-        self.client = TestClient(app)
-    
-    def test_health_endpoint_returns_200(self):
+    def test_health_endpoint_returns_200(self, client):
         """Test that /health returns HTTP 200."""
-        response = self.client.get("/health")
+        response = client.get("/health")
         assert response.status_code == 200
     
-    def test_health_endpoint_returns_json(self):
+    def test_health_endpoint_returns_json(self, client):
         """Test that /health returns valid JSON with expected structure."""
-        response = self.client.get("/health")
+        response = client.get("/health")
         json_data = response.json()
         
         assert "status" in json_data
@@ -28,14 +32,42 @@ class TestHealthEndpoint:
         assert json_data["status"] == "ok"
         assert json_data["version"] == "0.1.0"
     
-    def test_health_endpoint_has_request_id_header(self):
+    def test_health_endpoint_has_request_id_header(self, client):
         """Test that response includes X-Request-ID header."""
-        response = self.client.get("/health")
+        response = client.get("/health")
         assert "X-Request-ID" in response.headers
         assert len(response.headers["X-Request-ID"]) > 0
     
-    def test_health_endpoint_preserves_existing_request_id(self):
+    def test_health_endpoint_preserves_existing_request_id(self, client):
         """Test that existing X-Request-ID is preserved."""
         custom_id = "test-request-123"
-        response = self.client.get("/health", headers={"X-Request-ID": custom_id})
-        assert response.headers["X-Request-ID"] == custom_id
\ No newline at end of file
+        response = client.get("/health", headers={"X-Request-ID": custom_id})
+        assert response.headers["X-Request-ID"] == custom_id
+
+
+@pytest.fixture(scope="module")
+def echo_client():
+    """Client for an app whose route echoes the request ID it sees."""
+    echo_app = FastAPI()
+    echo_app.add_middleware(RequestIDMiddleware)
+    
+    @echo_app.get("/echo")
+    async def echo():
+        return {"request_id": request_id_ctx.get()}
+    
+    return TestClient(echo_app)
+
+
+class TestRequestIDContext:
+    """Test suite for exposing the request ID to route handlers."""
+    
+    def test_route_sees_incoming_request_id(self, echo_client):
+        """Test that a handler reads the X-Request-ID sent by the client."""
+        response = echo_client.get("/echo", headers={"X-Request-ID": "ctx-request-42"})
+        assert response.json() == {"request_id": "ctx-request-42"}
+    
+    def test_route_sees_generated_request_id(self, echo_client):
+        """Test that a handler reads the ID generated when the header is missing."""
+        response = echo_client.get("/echo")
+        assert response.json()["request_id"] == response.headers["X-Request-ID"]
+        assert response.json()["request_id"] != "unknown"
@@ -0,0 +1,25 @@
+# ABOUTME: Unit tests for the NASA POWER HTTP client retry policy
+# ABOUTME: Validates that connect failures are left to the transport's own retries
+
+import httpx
+import pytest
+from app.infrastructure.http_client import HTTPClient
+
+
+class TestHTTPClientRetries:
+    """Test suite for HTTPClient.get retry handling."""
+
+    async def test_connect_error_is_not_retried_by_backoff_loop(self):
+        """Test that a refused connection surfaces after one backoff attempt."""
+        attempts = []
+
+        def refuse(request: httpx.Request) -> httpx.Response:
+            attempts.append(request)
+            raise httpx.ConnectError("connection refused", request=request)
+
+        client = HTTPClient(retries=4)
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(refuse))
+
+        with pytest.raises(httpx.ConnectError):
+            await client.get("https://power.larc.nasa.gov/api/temporal/daily/point", {})
+        assert len(attempts) == 1
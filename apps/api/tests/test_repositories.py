@@ -0,0 +1,104 @@
+# ABOUTME: Unit tests for the NASA POWER repositories' response caching
+# ABOUTME: Drives the repositories through an httpx transport that counts upstream requests
+
+import asyncio
+from datetime import date
+import httpx
+import pytest
+from app.domain.enums import Granularity
+from app.infrastructure.http_client import HTTPClient
+from app.infrastructure.nasa_climate_repository import NASAClimateRepository
+from app.infrastructure.repositories import NASAWeatherDataRepository
+
+
+class CountingHTTPClient(HTTPClient):
+    """HTTPClient whose connection pool answers from an in-process transport."""
+
+    def __init__(self, status_code: int = 200, delay: float = 0.01):
+        super().__init__(retries=1)
+        self.requests = 0
+        self.status_code = status_code
+        self.delay = delay
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(self._respond))
+
+    async def _respond(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(self.delay)
+        return httpx.Response(self.status_code, json={"properties": {"parameter": {"T2M": {"JAN": 25.0}}}})
+
+
+def fetch_daily(repo: NASAWeatherDataRepository, granularity: Granularity = Granularity.DAILY):
+    return repo.fetch_temporal_data(-7.1, -34.8, granularity, date(2020, 1, 1), date(2020, 12, 31), ["T2M"])
+
+
+class TestWeatherRepositoryCache:
+    """Test suite for NASAWeatherDataRepository response caching."""
+
+    async def test_concurrent_identical_requests_share_one_fetch(self):
+        """Test that parallel identical calls make a single upstream request."""
+        client = CountingHTTPClient()
+        repo = NASAWeatherDataRepository(client)
+
+        first, second = await asyncio.gather(fetch_daily(repo), fetch_daily(repo))
+
+        assert client.requests == 1
+        assert first == second
+
+    async def test_daily_response_is_served_from_cache(self):
+        """Test that a repeated daily request does not reach the API again."""
+        client = CountingHTTPClient()
+        repo = NASAWeatherDataRepository(client)
+
+        await fetch_daily(repo)
+        await fetch_daily(repo)
+
+        assert client.requests == 1
+
+    async def test_hourly_response_is_not_stored(self):
+        """Test that hourly chunks are fetched again instead of being kept in memory."""
+        client = CountingHTTPClient()
+        repo = NASAWeatherDataRepository(client)
+
+        await fetch_daily(repo, Granularity.HOURLY)
+        await fetch_daily(repo, Granularity.HOURLY)
+
+        assert client.requests == 2
+
+    async def test_failure_reaches_every_waiter(self):
+        """Test that a failed shared fetch raises in each concurrent caller."""
+        client = CountingHTTPClient(status_code=400)
+        repo = NASAWeatherDataRepository(client)
+
+        results = await asyncio.gather(fetch_daily(repo), fetch_daily(repo), return_exceptions=True)
+
+        assert client.requests == 1
+        assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+
+        # Errors are not cached, so the next call retries upstream
+        with pytest.raises(httpx.HTTPStatusError):
+            await fetch_daily(repo)
+        assert client.requests == 2
+
+
+class TestClimateRepositoryCache:
+    """Test suite for NASAClimateRepository climatology caching."""
+
+    async def test_repeated_location_is_served_from_cache(self):
+        """Test that a location requested again makes no second HTTP call."""
+        client = CountingHTTPClient()
+        repo = NASAClimateRepository(client)
+
+        first = await repo.fetch_climatology_data(-7.1, -34.8, ["T2M"])
+        second = await repo.fetch_climatology_data(-7.1, -34.8, ["T2M"])
+
+        assert client.requests == 1
+        assert first == second == {"T2M": {"JAN": 25.0}}
+
+    async def test_concurrent_batch_locations_share_one_fetch(self):
+        """Test that duplicate coordinates in one batch make a single request."""
+        client = CountingHTTPClient()
+        repo = NASAClimateRepository(client)
+
+        await asyncio.gather(*(repo.fetch_climatology_data(-7.1, -34.8, ["T2M"]) for _ in range(3)))
+
+        assert client.requests == 1
@@ -0,0 +1,67 @@
+# ABOUTME: Unit tests for the bounded NASA POWER response cache
+# ABOUTME: Validates TTL expiry, oldest-entry eviction and cancellation of shared fetches
+
+import asyncio
+from app.infrastructure.response_cache import ResponseCache
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    async def test_expired_entry_is_fetched_again(self):
+        """Test that an entry older than the TTL triggers a fresh fetch."""
+        cache = ResponseCache(max_entries=4, ttl_seconds=0)
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            return {"value": len(calls)}
+
+        assert await cache.get_or_fetch("key", fetch) == {"value": 1}
+        assert await cache.get_or_fetch("key", fetch) == {"value": 2}
+
+    def test_oldest_entry_is_evicted_past_the_cap(self):
+        """Test that the cap drops the least recently stored key."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("c") == 3
+
+    async def test_last_cancelled_waiter_cancels_the_fetch(self):
+        """Test that the upstream fetch stops once nobody is waiting for it."""
+        cache = ResponseCache(max_entries=4)
+        fetch_cancelled = asyncio.Event()
+
+        async def fetch():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                fetch_cancelled.set()
+                raise
+
+        caller = asyncio.ensure_future(cache.get_or_fetch("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+
+        await asyncio.wait_for(fetch_cancelled.wait(), timeout=1)
+        assert cache.get("key") is None
+
+    async def test_cancelled_waiter_leaves_fetch_running_for_others(self):
+        """Test that one caller going away does not abort a shared fetch."""
+        cache = ResponseCache(max_entries=4)
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            return {"value": 1}
+
+        leaving = asyncio.ensure_future(cache.get_or_fetch("key", fetch))
+        staying = asyncio.ensure_future(cache.get_or_fetch("key", fetch))
+        await asyncio.sleep(0)
+        leaving.cancel()
+
+        assert await staying == {"value": 1}
+        assert cache.get("key") == {"value": 1}
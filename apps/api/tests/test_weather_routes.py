@@ -0,0 +1,35 @@
+# ABOUTME: Unit tests for the weather API routes
+# ABOUTME: Validates the static parameter catalogue served by /weather/parameters
+
+import pytest
+from fastapi.testclient import TestClient
+from app.main import app
+from app.infrastructure.config import DEFAULT_PARAMS, CLIMATOLOGY_PARAMS, HOURLY_UNAVAILABLE_PARAMS
+from app.presentation.weather_routes import PARAMETERS_RESPONSE
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Share one test client across the module."""
+    return TestClient(app)
+
+
+class TestParametersEndpoint:
+    """Test suite for the /weather/parameters endpoint."""
+
+    def test_lists_configured_parameters(self, client):
+        """Test that the catalogue mirrors the configured parameter sets."""
+        response = client.get("/weather/parameters")
+        assert response.status_code == 200
+
+        json_data = response.json()
+        assert json_data["default_parameters"] == DEFAULT_PARAMS
+        assert json_data["climatology_parameters"] == CLIMATOLOGY_PARAMS
+        assert json_data["hourly_unavailable"] == sorted(HOURLY_UNAVAILABLE_PARAMS)
+        assert json_data["granularity_options"] == ["daily", "hourly"]
+        assert set(json_data["default_parameters"]) <= set(json_data["parameter_descriptions"])
+
+    def test_catalogue_does_not_alias_config_lists(self):
+        """Test that the served catalogue holds copies of the config lists."""
+        assert PARAMETERS_RESPONSE["default_parameters"] is not DEFAULT_PARAMS
+        assert PARAMETERS_RESPONSE["climatology_parameters"] is not CLIMATOLOGY_PARAMS
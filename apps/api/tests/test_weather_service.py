@@ -0,0 +1,49 @@
+# ABOUTME: Unit tests for the weather analysis service's concurrent NASA POWER fetches
+# ABOUTME: Validates that a failed climatology fetch cancels the historical download
+
+import asyncio
+from datetime import datetime, timezone
+import httpx
+import pytest
+from app.application.weather_service import WeatherAnalysisService
+from app.domain.entities import WeatherAnalysisRequest
+from app.infrastructure.http_client import HTTPClient
+from app.infrastructure.repositories import NASAWeatherDataRepository
+
+
+class FailingClimatologyHTTPClient(HTTPClient):
+    """HTTPClient that rejects climatology requests and answers the rest slowly."""
+
+    def __init__(self):
+        super().__init__(retries=1)
+        self.history_completed = False
+        self._client = httpx.AsyncClient(transport=httpx.MockTransport(self._respond))
+
+    async def _respond(self, request: httpx.Request) -> httpx.Response:
+        if "climatology" in request.url.path:
+            return httpx.Response(400, json={})
+        await asyncio.sleep(0.2)
+        self.history_completed = True
+        return httpx.Response(200, json={"properties": {"parameter": {}}})
+
+
+class TestConcurrentFetches:
+    """Test suite for the climatology and history fetch task group."""
+
+    async def test_climatology_failure_cancels_history_fetch(self):
+        """Test that the first error surfaces and the other fetch stops."""
+        client = FailingClimatologyHTTPClient()
+        service = WeatherAnalysisService(NASAWeatherDataRepository(client))
+        request = WeatherAnalysisRequest(
+            latitude=-7.1,
+            longitude=-34.8,
+            center_datetime=datetime(2025, 1, 15, tzinfo=timezone.utc),
+            target_timezone="UTC"
+        )
+
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            await service.analyze_weather_range(request)
+        assert isinstance(exc_info.value.__cause__, ExceptionGroup)
+
+        await asyncio.sleep(0.3)
+        assert not client.history_completed
@@ -0,0 +1,166 @@
+# ABOUTME: Unit tests for weather data processing utilities
+# ABOUTME: Validates statistics, date key parsing, regression and heat index calculations
+
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
+import pytest
+from app.application.weather_utils import (
+    calculate_heat_index, calculate_heat_index_array, calculate_historical_stats, day_of_year,
+    predict_with_temporal_regression, seasonal_window_mask, series_to_arrays
+)
+from app.domain.enums import Granularity
+
+
+class TestHistoricalStats:
+    """Test suite for calculate_historical_stats."""
+
+    def test_stats_ignore_missing_values(self):
+        """Test that None entries are excluded from the statistics."""
+        series = {"T2M": {"20240101": 25.3, "20240102": None, "20240103": 27.1, "20240104": 26.0}}
+        stats = calculate_historical_stats(series)["T2M"]
+
+        assert stats.count == 3
+        assert stats.min == 25.3
+        assert stats.max == 27.1
+        assert stats.median == 26.0
+        assert stats.mean == pytest.approx(26.1333, abs=1e-4)
+        assert stats.std == pytest.approx(0.7409, abs=1e-4)
+
+    def test_stats_are_rounded(self):
+        """Test that reported statistics do not leak float32 noise."""
+        series = {"WS10M": {"20240101": 3.3, "20240102": 4.4}}
+        stats = calculate_historical_stats(series)["WS10M"]
+
+        assert stats.min == 3.3
+        assert stats.max == 4.4
+        assert stats.mean == 3.85
+        assert stats.median == 3.85
+
+    def test_stats_empty_series_is_none(self):
+        """Test that a series without valid values yields None."""
+        series = {"FRSNO": {"20240101": None}, "RH2M": {}}
+        stats = calculate_historical_stats(series)
+
+        assert stats["FRSNO"] is None
+        assert stats["RH2M"] is None
+
+
+class TestSeriesToArrays:
+    """Test suite for series_to_arrays date key parsing."""
+
+    def test_daily_keys_map_to_day_of_year(self):
+        """Test that leap years shift day-of-year after February."""
+        series = {"20240301": 1.0, "20230301": 2.0, "20241231": 3.0}
+        years, days_of_year, _, values = series_to_arrays(series, Granularity.DAILY)
+
+        assert years.tolist() == [2024, 2023, 2024]
+        assert days_of_year.tolist() == [61, 60, 366]
+        assert values.tolist() == [1.0, 2.0, 3.0]
+
+    def test_hourly_keys_split_hour(self):
+        """Test that hourly keys expose the hour component."""
+        series = {"2024010105": 1.0, "2024010123": 2.0}
+        _, days_of_year, hours, _ = series_to_arrays(series, Granularity.HOURLY)
+
+        assert days_of_year.tolist() == [1, 1]
+        assert hours.tolist() == [5, 23]
+
+    def test_invalid_keys_and_missing_values_are_dropped(self):
+        """Test that malformed dates and None values are excluded."""
+        series = {"20230229": 1.0, "2024xx01": 2.0, "20240101": None, "20240102": 4.0}
+        years, days_of_year, _, values = series_to_arrays(series, Granularity.DAILY)
+
+        assert days_of_year.tolist() == [2]
+        assert values.tolist() == [4.0]
+
+
+class TestDayOfYear:
+    """Test suite for day_of_year."""
+
+    @pytest.mark.parametrize("year", [1900, 2000, 2023, 2024])
+    def test_matches_calendar_across_leap_years(self, year):
+        """Test agreement with datetime's day-of-year for common and leap years."""
+        d = date(year, 1, 1)
+        while d.year == year:
+            assert day_of_year(d) == d.timetuple().tm_yday
+            d += timedelta(days=1)
+
+
+class TestSeasonalWindowMask:
+    """Test suite for seasonal_window_mask."""
+
+    def test_window_wraps_around_year_end(self):
+        """Test that a window near January 1st includes late December."""
+        mask = seasonal_window_mask(2, 3)
+        assert np.flatnonzero(mask).tolist() == [1, 2, 3, 4, 5, 364, 365]
+
+
+class TestTemporalRegression:
+    """Test suite for predict_with_temporal_regression."""
+
+    def test_extrapolates_yearly_trend(self):
+        """Test that yearly means inside the window are fitted linearly."""
+        series = {f"{year}0715": float(year - 2000) for year in range(2010, 2020)}
+        series["20190101"] = 100.0  # outside the seasonal window
+        target = datetime(2024, 7, 15, tzinfo=timezone.utc)
+
+        prediction = predict_with_temporal_regression(series, target, Granularity.DAILY, 15)
+        assert prediction == pytest.approx(24.0)
+
+    def test_no_data_in_window_returns_none(self):
+        """Test that a window without observations yields None."""
+        series = {"20190101": 1.0}
+        target = datetime(2024, 7, 15, tzinfo=timezone.utc)
+
+        assert predict_with_temporal_regression(series, target, Granularity.DAILY, 15) is None
+
+
+class TestHeatIndex:
+    """Test suite for heat index calculations."""
+
+    def test_array_matches_scalar(self):
+        """Test that the vectorized heat index agrees with the scalar version."""
+        temps = [20.0, 26.7, 30.0, 35.0, 40.0]
+        humidity = [80.0, 50.0, 39.0, 60.0, 90.0]
+        result = calculate_heat_index_array(np.array(temps), np.array(humidity))
+
+        expected = [calculate_heat_index(t, rh) for t, rh in zip(temps, humidity)]
+        assert result.tolist() == pytest.approx(expected)
+
+    def test_array_boundary_sweep(self):
+        """Test the regression cut-off across a temperature/humidity grid in one call."""
+        temps, humidity = np.meshgrid(np.linspace(25.0, 45.0, 41), np.linspace(0.0, 100.0, 51))
+        result = calculate_heat_index_array(temps, humidity)
+
+        regression = (temps >= 26.7) & (humidity >= 40)
+        np.testing.assert_array_equal(result[~regression], temps[~regression])
+
+        expected = np.array([calculate_heat_index(t, rh) for t, rh in zip(temps.ravel(), humidity.ravel())])
+        np.testing.assert_allclose(result.ravel(), expected, rtol=1e-12)
+
+    @pytest.mark.parametrize("temp_f,rh,table_f", [(90, 70, 106), (96, 65, 121), (100, 40, 109), (86, 90, 105), (104, 55, 137)])
+    def test_matches_nws_table(self, temp_f, rh, table_f):
+        """Test agreement with the rounded NWS heat index chart."""
+        expected_c = (table_f - 32.0) / 1.8
+        assert calculate_heat_index((temp_f - 32.0) / 1.8, rh) == pytest.approx(expected_c, abs=0.3)
+
+    def test_matches_expanded_rothfusz(self):
+        """Test that the nested evaluation equals the term-by-term regression."""
+        t_f, rh = np.meshgrid(np.linspace(81.0, 115.0, 35), np.linspace(40.0, 100.0, 31))
+        expanded_f = (
+            -42.379 + 2.04901523*t_f + 10.14333127*rh - 0.22475541*t_f*rh
+            - 6.83783e-3*t_f**2 - 5.481717e-2*rh**2 + 1.22874e-3*t_f**2*rh
+            + 8.5282e-4*t_f*rh**2 - 1.99e-6*t_f**2*rh**2
+        )
+        result = calculate_heat_index_array((t_f - 32.0) / 1.8, rh)
+        np.testing.assert_allclose(result, (expanded_f - 32.0) / 1.8, atol=1e-3)
+
+    @pytest.mark.parametrize("temp_c,rh", [(None, 60.0), (30.0, None), (30.0, float("nan")), (np.float32("nan"), 60.0)])
+    def test_scalar_rejects_missing_values(self, temp_c, rh):
+        """Test that None and NaN inputs yield None."""
+        assert calculate_heat_index(temp_c, rh) is None
+
+    def test_array_propagates_missing_values(self):
+        """Test that missing inputs yield NaN instead of a heat index."""
+        result = calculate_heat_index_array(np.array([20.0, 30.0, np.nan]), np.array([np.nan, np.nan, 60.0]))
+        assert np.isnan(result).all()